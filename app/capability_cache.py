@@ -0,0 +1,14 @@
+class CapabilityCacheMixin:
+    """
+    Cached available/maximum capability totals for a locker owner.
+
+    Subclasses call _init_capability_cache once their lockers are known,
+    then adjust the cached available total whenever a store or retrieve
+    succeeds, so report generation can read the totals without summing
+    over every locker again.
+    """
+    __slots__ = ("_available", "_max")
+
+    def _init_capability_cache(self, lockers):
+        self._max = sum(locker.capability for locker in lockers)
+        self._available = sum(locker.available_capability for locker in lockers)
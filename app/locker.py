@@ -1,4 +1,6 @@
-import uuid
+import operator
+
+_MISSING = object()
 
 class Locker:
     """
@@ -11,16 +13,21 @@ class Locker:
         TypeError: If capability is not an integer.
         ValueError: If capability is less than or equal to 0.
     """
+    __slots__ = ("capability", "available_capability", "stored_bags", "_ticket_seq")
+
     def __init__(self, capability):
-        if not isinstance(capability, int):
+        try:
+            capability = operator.index(capability)
+        except TypeError:
             raise TypeError("Capability must be an integer")
-        
+
         if capability <= 0:
             raise ValueError("Capability must be greater than 0")
             
         self.capability = capability
         self.available_capability = capability
         self.stored_bags = {}
+        self._ticket_seq = 0
         
     def store_bag(self, content):
         """
@@ -42,8 +49,10 @@ class Locker:
         if self.available_capability <= 0:
             raise ValueError("Locker is full")
             
-        # Generate a unique ticket ID
-        ticket = str(uuid.uuid4())
+        # Generate a unique ticket ID; the locker's identity plus a
+        # per-locker sequence number is unique without any randomness.
+        self._ticket_seq += 1
+        ticket = "%x-%x" % (id(self), self._ticket_seq)
         
         # Store the bag content with the ticket as the key
         self.stored_bags[ticket] = content
@@ -66,17 +75,14 @@ class Locker:
         Raises:
             ValueError: If the ticket is invalid or has already been used.
         """
-        # Check for valid ticket format and existence in one conditional
-        if not isinstance(ticket, str) or ticket not in self.stored_bags:
+        # Look up and remove the bag in a single dict operation; a
+        # non-string ticket simply misses the dict.
+        content = self.stored_bags.pop(ticket, _MISSING)
+
+        if content is _MISSING:
             raise ValueError("Invalid ticket")
-            
-        # Get the bag content
-        content = self.stored_bags[ticket]
-        
-        # Remove the bag from storage
-        del self.stored_bags[ticket]
-        
+
         # Restore capability
         self.available_capability += 1
-        
+
         return content
\ No newline at end of file
@@ -0,0 +1,73 @@
+import io
+import operator
+
+from app.locker_robot_manager import LockerRobotManager
+
+_get_available = operator.attrgetter("_available")
+_get_locker_available = operator.attrgetter("available_capability")
+
+class LockerRobotDirector:
+    """
+    A director that reports on the capability of its managers.
+
+    Args:
+        managers (list): The managers reporting to the director. Must
+            contain at least one LockerRobotManager instance.
+
+    Raises:
+        TypeError: If any item in managers is not a LockerRobotManager.
+        ValueError: If managers is empty.
+    """
+    __slots__ = ("managers", "_template", "_report_slots")
+
+    def __init__(self, managers):
+        if not managers:
+            raise ValueError("Must provide at least one manager")
+
+        for manager in managers:
+            if type(manager) is not LockerRobotManager:
+                raise TypeError("All items must be LockerRobotManager instances")
+
+        self.managers = tuple(managers)
+        self._build_report_template()
+
+    def _build_report_template(self):
+        # The hierarchy is fixed after construction, so the report's
+        # structure and maximum capabilities can be baked into a single
+        # template, leaving only the available totals to fill per call.
+        buffer = io.StringIO()
+        slots = []
+        write = buffer.write
+        slot_append = slots.append
+
+        for manager in self.managers:
+            write("M %%d %d\n" % manager._max)
+            slot_append((_get_available, manager))
+
+            for locker in manager.lockers:
+                write("    L %%d %d\n" % locker.capability)
+                slot_append((_get_locker_available, locker))
+
+            for robot in manager.robots:
+                write("  R %%d %d\n" % robot._max)
+                slot_append((_get_available, robot))
+
+                for locker in robot.lockers:
+                    write("    L %%d %d\n" % locker.capability)
+                    slot_append((_get_locker_available, locker))
+
+        self._template = buffer.getvalue()
+        self._report_slots = tuple(slots)
+
+    def generateReport(self):
+        """
+        Generate a capability report covering every manager.
+
+        Each manager contributes an M line with its total available and
+        maximum capability, followed by indented R lines for its robots
+        and L lines for each locker.
+
+        Returns:
+            str: The formatted report.
+        """
+        return self._template % tuple(get(owner) for get, owner in self._report_slots)
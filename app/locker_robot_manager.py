@@ -0,0 +1,129 @@
+import collections
+
+from app.capability_cache import CapabilityCacheMixin
+from app.locker import Locker
+
+class LockerRobotManager(CapabilityCacheMixin):
+    """
+    A manager that delegates bag storage to its robots and lockers.
+
+    Bags are handed to the managed robots first; the manager falls back
+    to its own lockers when every robot is full.
+
+    Args:
+        lockers (list): The lockers managed directly by the manager.
+        robots (list): The robots working for the manager. Each robot
+            must support store_bag and retrieve_bag.
+
+    Raises:
+        TypeError: If any locker is not a Locker instance, or any robot
+            does not support store_bag and retrieve_bag.
+        ValueError: If neither lockers nor robots are provided.
+    """
+    __slots__ = ("lockers", "robots", "_ticket_owner", "_full_robots", "_all_lockers", "_free_lockers")
+
+    def __init__(self, lockers, robots):
+        if not lockers and not robots:
+            raise ValueError("Must provide at least one locker or robot")
+
+        for locker in lockers or []:
+            if type(locker) is not Locker:
+                raise TypeError("All items must be Locker instances")
+
+        for robot in robots or []:
+            try:
+                store = robot.store_bag
+                retrieve = robot.retrieve_bag
+            except AttributeError:
+                raise TypeError("All robots must support store_bag and retrieve_bag")
+
+            if not (callable(store) and callable(retrieve)):
+                raise TypeError("All robots must support store_bag and retrieve_bag")
+
+        self.lockers = tuple(lockers or ())
+        self.robots = tuple(robots or ())
+        self._ticket_owner = {}
+        self._full_robots = set()
+        self._free_lockers = collections.deque(
+            index for index, locker in enumerate(self.lockers) if locker.available_capability > 0)
+
+        # Locker membership never changes after construction, so the
+        # flattened hierarchy can be computed once and reused.
+        self._all_lockers = self.lockers + tuple(
+            locker for robot in self.robots for locker in getattr(robot, "lockers", ()))
+        self._init_capability_cache(self._all_lockers)
+
+    def store_bag(self, content):
+        """
+        Store a bag via the first robot with room, or a locker otherwise.
+
+        Args:
+            content (str): The contents of the bag to store.
+
+        Returns:
+            str: A unique ticket ID for bag retrieval.
+
+        Raises:
+            TypeError: If content is not a string.
+            ValueError: If all robots and lockers are at full capacity.
+        """
+        for robot in self.robots:
+            if robot in self._full_robots:
+                continue
+
+            try:
+                ticket = robot.store_bag(content)
+            except ValueError:
+                self._full_robots.add(robot)
+                continue
+            self._ticket_owner[ticket] = (robot, None)
+            self._available -= 1
+            return ticket
+
+        while self._free_lockers:
+            index = self._free_lockers[0]
+            locker = self.lockers[index]
+
+            if locker.available_capability <= 0:
+                self._free_lockers.popleft()
+                continue
+
+            ticket = locker.store_bag(content)
+
+            if locker.available_capability == 0:
+                self._free_lockers.popleft()
+
+            self._ticket_owner[ticket] = (locker, index)
+            self._available -= 1
+            return ticket
+
+        raise ValueError("All lockers are full")
+
+    def retrieve_bag(self, ticket):
+        """
+        Retrieve a bag from whichever robot or locker holds the ticket.
+
+        Args:
+            ticket (str): The ticket issued when storing the bag.
+
+        Returns:
+            str: The content of the retrieved bag.
+
+        Raises:
+            ValueError: If the ticket is invalid or has already been used.
+        """
+        entry = self._ticket_owner.pop(ticket, None)
+
+        if entry is None:
+            raise ValueError("Invalid ticket")
+
+        owner, index = entry
+        content = owner.retrieve_bag(ticket)
+
+        if index is None:
+            self._full_robots.discard(owner)
+        elif owner.available_capability == 1:
+            self._free_lockers.append(index)
+
+        self._available += 1
+        return content
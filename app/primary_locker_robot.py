@@ -0,0 +1,70 @@
+from app.capability_cache import CapabilityCacheMixin
+from app.locker import Locker
+
+class PrimaryLockerRobot(CapabilityCacheMixin):
+    """
+    A robot that stores bags in the first locker with free capability.
+
+    Args:
+        lockers (list): The lockers managed by the robot. Must contain at
+            least one Locker instance.
+
+    Raises:
+        TypeError: If any item in lockers is not a Locker instance.
+        ValueError: If lockers is empty.
+    """
+    __slots__ = ("lockers",)
+
+    def __init__(self, lockers):
+        if not lockers:
+            raise ValueError("Must provide at least one locker")
+
+        for locker in lockers:
+            if type(locker) is not Locker:
+                raise TypeError("All items must be Locker instances")
+
+        self.lockers = tuple(lockers)
+        self._init_capability_cache(self.lockers)
+
+    def store_bag(self, content):
+        """
+        Store a bag in the first locker that has free capability.
+
+        Args:
+            content (str): The contents of the bag to store.
+
+        Returns:
+            str: A unique ticket ID for bag retrieval.
+
+        Raises:
+            TypeError: If content is not a string.
+            ValueError: If all lockers are at full capacity.
+        """
+        for locker in self.lockers:
+            if locker.available_capability > 0:
+                ticket = locker.store_bag(content)
+                self._available -= 1
+                return ticket
+
+        raise ValueError("All lockers are full")
+
+    def retrieve_bag(self, ticket):
+        """
+        Retrieve a bag from whichever locker holds the given ticket.
+
+        Args:
+            ticket (str): The ticket issued when storing the bag.
+
+        Returns:
+            str: The content of the retrieved bag.
+
+        Raises:
+            ValueError: If the ticket is invalid or has already been used.
+        """
+        for locker in self.lockers:
+            if ticket in locker.stored_bags:
+                content = locker.retrieve_bag(ticket)
+                self._available += 1
+                return content
+
+        raise ValueError("Invalid ticket")
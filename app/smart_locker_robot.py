@@ -0,0 +1,95 @@
+import heapq
+
+from app.capability_cache import CapabilityCacheMixin
+from app.locker import Locker
+
+class SmartLockerRobot(CapabilityCacheMixin):
+    """
+    A robot that stores bags in the locker with the most free capability.
+
+    Args:
+        lockers (list): The lockers managed by the robot. Must contain at
+            least one Locker instance.
+
+    Raises:
+        TypeError: If any item in lockers is not a Locker instance.
+        ValueError: If lockers is empty.
+    """
+    __slots__ = ("lockers", "_heap", "_ticket_owner")
+
+    def __init__(self, lockers):
+        if not lockers:
+            raise ValueError("Must provide at least one locker")
+
+        for locker in lockers:
+            if type(locker) is not Locker:
+                raise TypeError("All items must be Locker instances")
+
+        self.lockers = tuple(lockers)
+        self._init_capability_cache(self.lockers)
+
+        # Max-heap keyed by available capability, with the locker's
+        # position breaking ties so the first locker still wins. Entries
+        # go stale when a locker changes outside a heap operation; stale
+        # entries are skipped lazily because every change pushes a fresh
+        # entry.
+        self._heap = [(-locker.available_capability, index, locker) for index, locker in enumerate(self.lockers)]
+        heapq.heapify(self._heap)
+
+        self._ticket_owner = {}
+
+    def store_bag(self, content):
+        """
+        Store a bag in the locker with the largest available capability.
+
+        Args:
+            content (str): The contents of the bag to store.
+
+        Returns:
+            str: A unique ticket ID for bag retrieval.
+
+        Raises:
+            TypeError: If content is not a string.
+            ValueError: If all lockers are at full capacity.
+        """
+        while self._heap:
+            negative_available, index, target = self._heap[0]
+
+            if -negative_available != target.available_capability:
+                heapq.heappop(self._heap)
+                continue
+
+            if target.available_capability <= 0:
+                break
+
+            ticket = target.store_bag(content)
+            heapq.heapreplace(self._heap, (-target.available_capability, index, target))
+            self._ticket_owner[ticket] = (index, target)
+            self._available -= 1
+            return ticket
+
+        raise ValueError("All lockers are full")
+
+    def retrieve_bag(self, ticket):
+        """
+        Retrieve a bag from whichever locker holds the given ticket.
+
+        Args:
+            ticket (str): The ticket issued when storing the bag.
+
+        Returns:
+            str: The content of the retrieved bag.
+
+        Raises:
+            ValueError: If the ticket is invalid or has already been used.
+        """
+        owner = self._ticket_owner.pop(ticket, None)
+
+        if owner is None:
+            raise ValueError("Invalid ticket")
+
+        index, locker = owner
+        content = locker.retrieve_bag(ticket)
+        heapq.heappush(self._heap, (-locker.available_capability, index, locker))
+        self._available += 1
+        return content
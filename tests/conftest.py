@@ -0,0 +1,25 @@
+import pytest
+from app.locker import Locker
+from app.primary_locker_robot import PrimaryLockerRobot
+from app.smart_locker_robot import SmartLockerRobot
+from app.super_locker_robot import SuperLockerRobot
+
+ROBOT_CLASSES = (PrimaryLockerRobot, SmartLockerRobot, SuperLockerRobot)
+
+INVALID_BAG_CONTENT = (123, ["item"], None)
+INVALID_BAG_IDS = ("int", "list", "none")
+
+def caps(*lockers):
+    return tuple(locker.available_capability for locker in lockers)
+
+@pytest.fixture(params=ROBOT_CLASSES, ids=lambda robot_cls: robot_cls.__name__)
+def robot_cls(request):
+    return request.param
+
+@pytest.fixture
+def make_robot():
+    def _make(robot_cls, capabilities):
+        lockers = [Locker(capability) for capability in capabilities]
+        return robot_cls(lockers), lockers
+
+    return _make
@@ -0,0 +1,87 @@
+import pytest
+from app.locker import Locker
+from app.locker_robot_director import LockerRobotDirector
+from app.locker_robot_manager import LockerRobotManager
+from app.primary_locker_robot import PrimaryLockerRobot
+
+def test_locker_robot_director_with_invalid_managers():
+    with pytest.raises(ValueError) as excinfo:
+        LockerRobotDirector([])
+
+    assert str(excinfo.value) == "Must provide at least one manager"
+
+    with pytest.raises(TypeError) as excinfo:
+        LockerRobotDirector(["not a manager"])
+
+    assert str(excinfo.value) == "All items must be LockerRobotManager instances"
+
+def test_locker_robot_director_keeps_managers():
+    manager1 = LockerRobotManager([Locker(1)], [])
+    manager2 = LockerRobotManager([Locker(2)], [])
+    director = LockerRobotDirector([manager1, manager2])
+
+    assert director.managers == (manager1, manager2)
+
+def test_generate_report_for_manager_with_lockers():
+    manager = LockerRobotManager([Locker(2), Locker(3)], [])
+    director = LockerRobotDirector([manager])
+
+    assert director.generateReport() == (
+        "M 5 5\n"
+        "    L 2 2\n"
+        "    L 3 3\n"
+    )
+
+def test_generate_report_for_manager_with_robots():
+    robot = PrimaryLockerRobot([Locker(3), Locker(1)])
+    manager = LockerRobotManager([Locker(2)], [robot])
+    director = LockerRobotDirector([manager])
+
+    assert director.generateReport() == (
+        "M 6 6\n"
+        "    L 2 2\n"
+        "  R 4 4\n"
+        "    L 3 3\n"
+        "    L 1 1\n"
+    )
+
+def test_generate_report_reflects_stored_bags():
+    robot = PrimaryLockerRobot([Locker(2)])
+    manager = LockerRobotManager([Locker(1)], [robot])
+    director = LockerRobotDirector([manager])
+
+    manager.store_bag("bag 1")
+
+    assert director.generateReport() == (
+        "M 2 3\n"
+        "    L 1 1\n"
+        "  R 1 2\n"
+        "    L 1 2\n"
+    )
+
+def test_generate_report_after_retrieving_bag():
+    robot = PrimaryLockerRobot([Locker(2)])
+    manager = LockerRobotManager([Locker(1)], [robot])
+    director = LockerRobotDirector([manager])
+
+    ticket = manager.store_bag("bag 1")
+    manager.retrieve_bag(ticket)
+
+    assert director.generateReport() == (
+        "M 3 3\n"
+        "    L 1 1\n"
+        "  R 2 2\n"
+        "    L 2 2\n"
+    )
+
+def test_generate_report_for_multiple_managers():
+    manager1 = LockerRobotManager([Locker(1)], [])
+    manager2 = LockerRobotManager([Locker(2)], [])
+    director = LockerRobotDirector([manager1, manager2])
+
+    assert director.generateReport() == (
+        "M 1 1\n"
+        "    L 1 1\n"
+        "M 2 2\n"
+        "    L 2 2\n"
+    )
@@ -0,0 +1,98 @@
+import pytest
+from app.locker import Locker
+from app.locker_robot_manager import LockerRobotManager
+from app.primary_locker_robot import PrimaryLockerRobot
+from app.smart_locker_robot import SmartLockerRobot
+
+from tests.conftest import INVALID_BAG_CONTENT, INVALID_BAG_IDS, caps
+
+def test_locker_robot_manager_with_invalid_lockers():
+    with pytest.raises(ValueError) as excinfo:
+        LockerRobotManager([], [])
+
+    assert str(excinfo.value) == "Must provide at least one locker or robot"
+
+    with pytest.raises(TypeError) as excinfo:
+        LockerRobotManager(["not a locker"], [])
+
+    assert str(excinfo.value) == "All items must be Locker instances"
+
+    with pytest.raises(TypeError) as excinfo:
+        LockerRobotManager([Locker(1), "not a locker"], [])
+
+    assert str(excinfo.value) == "All items must be Locker instances"
+
+def test_locker_robot_manager_with_invalid_robots():
+    with pytest.raises(TypeError) as excinfo:
+        LockerRobotManager([], ["not a robot"])
+
+    assert str(excinfo.value) == "All robots must support store_bag and retrieve_bag"
+
+@pytest.mark.parametrize("content", INVALID_BAG_CONTENT, ids=INVALID_BAG_IDS)
+def test_store_bag_with_invalid_content(content):
+    manager = LockerRobotManager([Locker(1)], [])
+
+    with pytest.raises(TypeError) as excinfo:
+        manager.store_bag(content)
+
+    assert str(excinfo.value) == "Bag content must be a string"
+
+def test_store_bag_prefers_robots_over_own_lockers():
+    manager_locker = Locker(1)
+    robot_locker = Locker(1)
+    robot = PrimaryLockerRobot([robot_locker])
+    manager = LockerRobotManager([manager_locker], [robot])
+
+    manager.store_bag("bag 1")
+
+    assert caps(robot_locker, manager_locker) == (0, 1)
+
+def test_store_bag_falls_back_to_own_lockers():
+    manager_locker = Locker(1)
+    robot = PrimaryLockerRobot([Locker(1)])
+    manager = LockerRobotManager([manager_locker], [robot])
+
+    manager.store_bag("bag 1")
+    manager.store_bag("bag 2")
+
+    assert manager_locker.available_capability == 0
+
+def test_store_bag_when_everything_is_full():
+    robot = SmartLockerRobot([Locker(1)])
+    manager = LockerRobotManager([Locker(1)], [robot])
+    manager.store_bag("bag 1")
+    manager.store_bag("bag 2")
+
+    with pytest.raises(ValueError) as excinfo:
+        manager.store_bag("bag 3")
+
+    assert str(excinfo.value) == "All lockers are full"
+
+def test_retrieve_bag_from_robot_and_own_locker():
+    robot = PrimaryLockerRobot([Locker(1)])
+    manager = LockerRobotManager([Locker(1)], [robot])
+
+    ticket1 = manager.store_bag("bag 1")
+    ticket2 = manager.store_bag("bag 2")
+
+    assert manager.retrieve_bag(ticket1) == "bag 1"
+    assert manager.retrieve_bag(ticket2) == "bag 2"
+
+def test_retrieve_bag_with_invalid_ticket():
+    manager = LockerRobotManager([Locker(1)], [])
+    manager.store_bag("bag 1")
+
+    with pytest.raises(ValueError) as excinfo:
+        manager.retrieve_bag("invalid ticket")
+
+    assert str(excinfo.value) == "Invalid ticket"
+
+def test_retrieve_bag_with_used_ticket():
+    manager = LockerRobotManager([Locker(1)], [])
+    ticket = manager.store_bag("bag 1")
+    manager.retrieve_bag(ticket)
+
+    with pytest.raises(ValueError) as excinfo:
+        manager.retrieve_bag(ticket)
+
+    assert str(excinfo.value) == "Invalid ticket"
@@ -0,0 +1,56 @@
+import pytest
+from app.primary_locker_robot import PrimaryLockerRobot
+
+from tests.conftest import caps
+
+def test_store_bag_uses_first_available_locker(make_robot):
+    robot, (locker1, locker2) = make_robot(PrimaryLockerRobot, [2, 2])
+
+    robot.store_bag("bag 1")
+
+    assert caps(locker1, locker2) == (1, 2)
+
+def test_store_bag_skips_full_lockers(make_robot):
+    robot, (locker1, locker2) = make_robot(PrimaryLockerRobot, [1, 1])
+
+    robot.store_bag("bag 1")
+    robot.store_bag("bag 2")
+
+    assert caps(locker1, locker2) == (0, 0)
+
+def test_store_bag_when_all_lockers_are_full(make_robot):
+    robot, _ = make_robot(PrimaryLockerRobot, [1, 1])
+    robot.store_bag("bag 1")
+    robot.store_bag("bag 2")
+
+    with pytest.raises(ValueError) as excinfo:
+        robot.store_bag("bag 3")
+
+    assert str(excinfo.value) == "All lockers are full"
+
+def test_retrieve_bag_with_valid_ticket(make_robot):
+    robot, _ = make_robot(PrimaryLockerRobot, [1, 1])
+    ticket1 = robot.store_bag("bag 1")
+    ticket2 = robot.store_bag("bag 2")
+
+    assert robot.retrieve_bag(ticket2) == "bag 2"
+    assert robot.retrieve_bag(ticket1) == "bag 1"
+
+def test_retrieve_bag_with_invalid_ticket(make_robot):
+    robot, _ = make_robot(PrimaryLockerRobot, [1])
+    robot.store_bag("bag 1")
+
+    with pytest.raises(ValueError) as excinfo:
+        robot.retrieve_bag("invalid ticket")
+
+    assert str(excinfo.value) == "Invalid ticket"
+
+def test_retrieve_bag_with_used_ticket(make_robot):
+    robot, _ = make_robot(PrimaryLockerRobot, [1])
+    ticket = robot.store_bag("bag 1")
+    robot.retrieve_bag(ticket)
+
+    with pytest.raises(ValueError) as excinfo:
+        robot.retrieve_bag(ticket)
+
+    assert str(excinfo.value) == "Invalid ticket"
@@ -0,0 +1,29 @@
+import pytest
+from app.smart_locker_robot import SmartLockerRobot
+from app.super_locker_robot import SuperLockerRobot
+
+BAG_TRAFFIC_STEPS = [
+    ("store", "bag 1"),
+    ("store", "bag 2"),
+    ("store", "bag 3"),
+    ("retrieve", "bag 1"),
+    ("retrieve", "bag 3"),
+    ("retrieve", "bag 2"),
+]
+
+def run_scenario(robot, steps):
+    tickets = {}
+
+    for action, bag in steps:
+        if action == "store":
+            tickets[bag] = robot.store_bag(bag)
+        else:
+            assert robot.retrieve_bag(tickets.pop(bag)) == bag
+
+@pytest.mark.parametrize("robot_cls,steps", [
+    (SmartLockerRobot, BAG_TRAFFIC_STEPS),
+    (SuperLockerRobot, BAG_TRAFFIC_STEPS),
+], ids=["SmartLockerRobot", "SuperLockerRobot"])
+def test_retrieve_bag_after_storing_multiple_bags(robot_cls, steps, make_robot):
+    robot, _ = make_robot(robot_cls, [2, 2])
+    run_scenario(robot, steps)
@@ -0,0 +1,24 @@
+import pytest
+from app.locker import Locker
+
+from tests.conftest import INVALID_BAG_CONTENT, INVALID_BAG_IDS
+
+@pytest.mark.parametrize("bad,exc,message", [
+    ([], ValueError, "Must provide at least one locker"),
+    (["not a locker"], TypeError, "All items must be Locker instances"),
+    ([Locker(1), "not a locker"], TypeError, "All items must be Locker instances"),
+])
+def test_invalid_lockers(robot_cls, bad, exc, message):
+    with pytest.raises(exc) as excinfo:
+        robot_cls(bad)
+
+    assert str(excinfo.value) == message
+
+@pytest.mark.parametrize("content", INVALID_BAG_CONTENT, ids=INVALID_BAG_IDS)
+def test_store_bag_with_invalid_content(robot_cls, content, make_robot):
+    robot, _ = make_robot(robot_cls, [1])
+
+    with pytest.raises(TypeError) as excinfo:
+        robot.store_bag(content)
+
+    assert str(excinfo.value) == "Bag content must be a string"
@@ -0,0 +1,51 @@
+import pytest
+from app.smart_locker_robot import SmartLockerRobot
+
+from tests.conftest import caps
+
+def test_store_bag_uses_locker_with_max_capability(make_robot):
+    robot, (locker1, locker2) = make_robot(SmartLockerRobot, [1, 3])
+
+    robot.store_bag("bag 1")
+
+    assert caps(locker1, locker2) == (1, 2)
+
+def test_store_multiple_bags_prioritizes_max_capability(make_robot):
+    robot, (locker1, locker2, locker3) = make_robot(SmartLockerRobot, [3, 2, 1])
+
+    robot.store_bag("bag 1")
+
+    assert caps(locker1, locker2, locker3) == (2, 2, 1)
+
+    robot.store_bag("bag 2")
+
+    assert caps(locker1, locker2, locker3) == (1, 2, 1)
+
+def test_store_bag_when_all_lockers_are_full(make_robot):
+    robot, _ = make_robot(SmartLockerRobot, [1, 1])
+    robot.store_bag("bag 1")
+    robot.store_bag("bag 2")
+
+    with pytest.raises(ValueError) as excinfo:
+        robot.store_bag("bag 3")
+
+    assert str(excinfo.value) == "All lockers are full"
+
+def test_retrieve_bag_with_invalid_ticket(make_robot):
+    robot, _ = make_robot(SmartLockerRobot, [1])
+    robot.store_bag("bag 1")
+
+    with pytest.raises(ValueError) as excinfo:
+        robot.retrieve_bag("invalid ticket")
+
+    assert str(excinfo.value) == "Invalid ticket"
+
+def test_retrieve_bag_with_used_ticket(make_robot):
+    robot, _ = make_robot(SmartLockerRobot, [1])
+    ticket = robot.store_bag("bag 1")
+    robot.retrieve_bag(ticket)
+
+    with pytest.raises(ValueError) as excinfo:
+        robot.retrieve_bag(ticket)
+
+    assert str(excinfo.value) == "Invalid ticket"
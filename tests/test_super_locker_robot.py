@@ -0,0 +1,42 @@
+import pytest
+from app.super_locker_robot import SuperLockerRobot
+
+from tests.conftest import caps
+
+def test_store_bag_uses_locker_with_max_vacancy_rate(make_robot):
+    robot, (locker1, locker2) = make_robot(SuperLockerRobot, [2, 4])
+
+    locker2.store_bag("bag 1")
+    locker2.store_bag("bag 2")
+    robot.store_bag("bag 3")
+
+    assert caps(locker1, locker2) == (1, 2)
+
+def test_store_bag_when_all_lockers_are_full(make_robot):
+    robot, _ = make_robot(SuperLockerRobot, [1, 1])
+    robot.store_bag("bag 1")
+    robot.store_bag("bag 2")
+
+    with pytest.raises(ValueError) as excinfo:
+        robot.store_bag("bag 3")
+
+    assert str(excinfo.value) == "All lockers are full"
+
+def test_retrieve_bag_with_invalid_ticket(make_robot):
+    robot, _ = make_robot(SuperLockerRobot, [1])
+    robot.store_bag("bag 1")
+
+    with pytest.raises(ValueError) as excinfo:
+        robot.retrieve_bag("invalid ticket")
+
+    assert str(excinfo.value) == "Invalid ticket"
+
+def test_retrieve_bag_with_used_ticket(make_robot):
+    robot, _ = make_robot(SuperLockerRobot, [1])
+    ticket = robot.store_bag("bag 1")
+    robot.retrieve_bag(ticket)
+
+    with pytest.raises(ValueError) as excinfo:
+        robot.retrieve_bag(ticket)
+
+    assert str(excinfo.value) == "Invalid ticket"